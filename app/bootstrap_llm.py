@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from pathlib import Path
-from app.settings import AppConfig
+import os
+from app.settings import AppConfig, get_app_base_dir
+
+# Optional: when hf_transfer is installed, let huggingface_hub use its multi-connection
+# downloader for the large gguf files. This must be set before huggingface_hub is imported.
+try:
+    import hf_transfer  # type: ignore  # noqa: F401
+except ImportError:
+    pass
+else:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 try:
     from huggingface_hub import hf_hub_download  # type: ignore
@@ -33,89 +44,99 @@ def ensure_en_core_web_sm() -> None:
         )
 
 
-def get_app_base_dir() -> Path:
-    # Get base directory to store model
-    # Base directory is .appdata while in dev mode
-    return Path(".appdata").resolve()
-
-def ensure_gguf(app_cfg: AppConfig, model_dir: Path) -> Path:
-    # Make the models directory if it's not already created
-    model_dir.mkdir(parents=True, exist_ok=True)
+def _existing_file(path: str | Path | None) -> Path | None:
+    # Return the resolved path if it already points at a file, else None
+    if path is None:
+        return None
+    resolved = Path(path).expanduser().resolve()
+    return resolved if resolved.is_file() else None
 
-    # Get the gguf path from the configuration app_cfg and return the path
-    gguf_path = app_cfg.llm_config.llama_gguf_path
-    if gguf_path is not None:
-        gguf_path = Path(gguf_path).expanduser().resolve()
-        if gguf_path.exists() and gguf_path.is_file():
-            return gguf_path
+def _require_hf_hub() -> None:
+    if hf_hub_download is None:
+        raise RuntimeError(
+            "huggingface_hub is not installed. Install dependencies before bootstrapping models."
+        )
 
-    # If it does not exist, raise an error
+def _require_gguf_metadata(app_cfg: AppConfig) -> None:
     if not app_cfg.llm_config.hf_repo_id or not app_cfg.llm_config.hf_filename:
         raise RuntimeError(
             "Missing Hugging Face metadata for GGUF. Set hf_repo_id and hf_filename in llm_config."
         )
 
-    # Download the model from hugging face using details from the app_cfg
-    # Make sure the gguf goes into the models folder - normalize if hugging face created nested paths
-    if hf_hub_download is None:
-        raise RuntimeError(
-            "huggingface_hub is not installed. Install dependencies before bootstrapping models."
-        )
+def _require_mmproj_metadata(app_cfg: AppConfig) -> None:
+    if not app_cfg.llm_config.hf_repo_id:
+        raise RuntimeError("Missing hf_repo_id required for mmproj download.")
+
+def _local_gguf(app_cfg: AppConfig) -> Path | None:
+    # Return the configured gguf if it is already on disk.
+    # Otherwise check that it can be downloaded and return None
+    gguf_path = _existing_file(app_cfg.llm_config.llama_gguf_path)
+    if gguf_path is not None:
+        return gguf_path
+    _require_gguf_metadata(app_cfg)
+    _require_hf_hub()
+    return None
+
+def _local_mmproj(app_cfg: AppConfig) -> Path | None:
+    # Same as _local_gguf, for a configured mmproj
+    mmproj_path = _existing_file(app_cfg.llm_config.llama_mmproj_path)
+    if mmproj_path is not None:
+        return mmproj_path
+    _require_mmproj_metadata(app_cfg)
+    _require_hf_hub()
+    return None
+
+def _download_from_hf(app_cfg: AppConfig, filename: str, target_dir: Path, label: str) -> Path:
+    # Shared download step for ensure_gguf and ensure_mmproj
     try:
         downloaded = hf_hub_download(
             repo_id=app_cfg.llm_config.hf_repo_id,
-            filename=app_cfg.llm_config.hf_filename,
+            filename=filename,
             revision=app_cfg.llm_config.hf_revision,
-            local_dir=str(model_dir),
+            local_dir=str(target_dir),
             local_dir_use_symlinks=False,
         )
     except Exception as exc:
-        raise RuntimeError(f"Failed to download GGUF from Hugging Face: {exc}") from exc
+        raise RuntimeError(f"Failed to download {label} from Hugging Face: {exc}") from exc
 
     resolved = Path(downloaded).expanduser().resolve()
-    if not resolved.exists() or not resolved.is_file():
-        raise RuntimeError(f"Downloaded GGUF file is invalid: {resolved}")
+    # is_file() is False for missing paths, so one stat covers both checks
+    if not resolved.is_file():
+        raise RuntimeError(f"Downloaded {label} file is invalid: {resolved}")
     return resolved
 
+
+def ensure_gguf(app_cfg: AppConfig, model_dir: Path) -> Path:
+    # Make the models directory if it's not already created
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    # Return the configured gguf if it exists, or raise an error if it cannot be downloaded
+    gguf_path = _local_gguf(app_cfg)
+    if gguf_path is not None:
+        return gguf_path
+
+    # Download the model from hugging face using details from the app_cfg
+    # Make sure the gguf goes into the models folder - normalize if hugging face created nested paths
+    return _download_from_hf(app_cfg, app_cfg.llm_config.hf_filename, model_dir, "GGUF")
+
 def ensure_mmproj(app_cfg: AppConfig, models_dir: Path) -> Path | None:
     # If no mmproj is identified in app_cfg then return None
     mmproj_filename = app_cfg.llm_config.hf_mmproj_filename
     if not mmproj_filename:
         return None
 
-    existing = app_cfg.llm_config.llama_mmproj_path
+    existing = _local_mmproj(app_cfg)
     if existing is not None:
-        existing = Path(existing).expanduser().resolve()
-        if existing.exists() and existing.is_file():
-            return existing
+        return existing
 
     # Same as ensure_gguf - download it if not downloaded and normalize path
-    if not app_cfg.llm_config.hf_repo_id:
-        raise RuntimeError("Missing hf_repo_id required for mmproj download.")
-    if hf_hub_download is None:
-        raise RuntimeError(
-            "huggingface_hub is not installed. Install dependencies before bootstrapping models."
-        )
-    try:
-        downloaded = hf_hub_download(
-            repo_id=app_cfg.llm_config.hf_repo_id,
-            filename=mmproj_filename,
-            revision=app_cfg.llm_config.hf_revision,
-            local_dir=str(models_dir),
-            local_dir_use_symlinks=False,
-        )
-    except Exception as exc:
-        raise RuntimeError(f"Failed to download mmproj from Hugging Face: {exc}") from exc
-    resolved = Path(downloaded).expanduser().resolve()
-    if not resolved.exists() or not resolved.is_file():
-        raise RuntimeError(f"Downloaded mmproj file is invalid: {resolved}")
-    return resolved
+    return _download_from_hf(app_cfg, mmproj_filename, models_dir, "mmproj")
 
 def ensure_llm_server_bin(app_cfg: AppConfig) -> Path:
     # Ensure that the server binary exists and return the path.
     # If it doesn't exist, return an error
     server_bin = app_cfg.llm_server.llama_server_path.expanduser().resolve()
-    if not server_bin.exists() or not server_bin.is_file():
+    if not server_bin.is_file():
         raise RuntimeError(
             f"llama-server binary not found at {server_bin}. Build/install llama-server first."
         )
@@ -128,10 +149,29 @@ def bootstrap_llm(app_cfg: AppConfig) -> AppConfig:
     # Resolve the app's base directory where the data/models are stored (.appdata)
     base_dir = get_app_base_dir()
     models_dir = base_dir / "models"
+    models_dir.mkdir(parents=True, exist_ok=True)
 
     # Ensure the model files are available
-    gguf_path = ensure_gguf(app_cfg, models_dir)
-    mmproj_path = ensure_mmproj(app_cfg, models_dir)
+    # Files already on disk are reused, and a missing file that cannot be downloaded
+    # raises here, before any transfer starts
+    llm_cfg = app_cfg.llm_config
+    gguf_path = _local_gguf(app_cfg)
+    mmproj_path = _local_mmproj(app_cfg) if llm_cfg.hf_mmproj_filename else None
+
+    # The gguf and mmproj downloads are independent network transfers, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        gguf_future = None
+        mmproj_future = None
+        if gguf_path is None:
+            gguf_future = pool.submit(_download_from_hf, app_cfg, llm_cfg.hf_filename, models_dir, "GGUF")
+        if llm_cfg.hf_mmproj_filename and mmproj_path is None:
+            mmproj_future = pool.submit(
+                _download_from_hf, app_cfg, llm_cfg.hf_mmproj_filename, models_dir, "mmproj"
+            )
+        if gguf_future is not None:
+            gguf_path = gguf_future.result()
+        if mmproj_future is not None:
+            mmproj_path = mmproj_future.result()
 
     # Ensure the llm server binary exists
     server_bin = ensure_llm_server_bin(app_cfg)
@@ -145,9 +185,9 @@ def bootstrap_llm(app_cfg: AppConfig) -> AppConfig:
     new_llm_server = replace(app_cfg.llm_server, llama_server_path=server_bin)
 
     # Validate the resolved configuration
+    # llm_request is unchanged here and was already validated by build_settings
     new_llm_config.validate(allow_unresolved_model_paths=False)
     new_llm_server.validate()
-    app_cfg.llm_request.validate()
 
     # Return a new app configuration with updated app_cfg settings
     return replace(app_cfg, llm_config=new_llm_config, llm_server=new_llm_server)
@@ -5,7 +5,6 @@ from services.llm_service import LlmService
 from services.explainability import ExplainabilityRecorder
 from inout.explainability_writer import ExplainabilityWriter
 from services.ged_service import GedService
-from nlp.ged.ged_bert import GedBertDetector
 from inout.docx_loader import DocxLoader
 from services.docx_output_service import DocxOutputService
 
@@ -49,6 +48,8 @@ def build_container(app_cfg: AppConfig):
 
     # ----- GED BERT -----
     # Load the GED BERT model and wrap the grammar detector in a service abstraction
+    # Imported here so that importing this module does not pull in torch/transformers
+    from nlp.ged.ged_bert import GedBertDetector
     ged_detector = GedBertDetector(model_name=app_cfg.ged_config.model_name)
     ged_service = GedService(detector=ged_detector)
     
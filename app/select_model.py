@@ -6,17 +6,20 @@ import json
 import os
 
 try:
-    import psutil  # type: ignore
+    import orjson  # type: ignore
 except ImportError:
-    psutil = None
+    orjson = None
 
-try:
-    import torch  # type: ignore
-except ImportError:
-    torch = None
+from app.settings import AppConfig, get_app_base_dir
+from config.llm_model_spec import LlmModelSpec, MODEL_SPECS, MODEL_SPECS_BY_KEY
 
-from app.settings import AppConfig
-from config.llm_model_spec import LlmModelSpec, MODEL_SPECS
+def _stdlib_json_dumps(payload: object) -> bytes:
+    """Serialize compact JSON to UTF-8 bytes."""
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+# The persisted model key file is read and written through these; use orjson when it is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+_json_dumps = orjson.dumps if orjson is not None else _stdlib_json_dumps
 
 @dataclass(frozen=True, slots=True)
 class HardwareInfo:
@@ -34,7 +37,19 @@ class HardwareInfo:
 def get_hardware_info() -> HardwareInfo:
     """
     Collect basic hardware stats used to filter and recommend models.
+    psutil and torch are imported here rather than at module level so that
+    importing this module does not pay the torch start-up cost.
     """
+    try:
+        import psutil  # type: ignore
+    except ImportError:
+        psutil = None
+
+    try:
+        import torch  # type: ignore
+    except ImportError:
+        torch = None
+
     if psutil is not None:
         total_ram_gb = psutil.virtual_memory().total / (1024 ** 3)
     else:
@@ -75,12 +90,22 @@ def _fits_model(spec: LlmModelSpec, hw: HardwareInfo) -> bool:
 
 def recommend_model(specs: list[LlmModelSpec], hw: HardwareInfo) -> LlmModelSpec:
     """Pick the largest model that fits the current hardware."""
-    # Best quality = largest model that fits
-    ranked = sorted(specs, key=lambda s: (s.min_ram_gb, s.min_vram_gb), reverse=True)
-    for spec in ranked:
-        if _fits_model(spec, hw):
-            return spec
-    return ranked[-1]
+    # Best quality = largest model that fits; fall back to the smallest model.
+    # On equal (min_ram_gb, min_vram_gb), the first listed spec wins for the best fit
+    # and the last listed spec wins for the smallest fallback.
+    best: LlmModelSpec | None = None
+    smallest: LlmModelSpec | None = None
+    for spec in specs:
+        size = (spec.min_ram_gb, spec.min_vram_gb)
+        if smallest is None or size <= (smallest.min_ram_gb, smallest.min_vram_gb):
+            smallest = spec
+        if _fits_model(spec, hw) and (best is None or size > (best.min_ram_gb, best.min_vram_gb)):
+            best = spec
+    if best is not None:
+        return best
+    if smallest is None:
+        raise ValueError("recommend_model requires at least one model spec")
+    return smallest
 
 def _persist_path(base_dir: Path) -> Path:
     """
@@ -99,13 +124,13 @@ def get_models_dir(base_dir: Path) -> Path:
 def is_model_downloaded(spec: LlmModelSpec, models_dir: Path) -> bool:
     """
     Check whether the GGUF model file exists locally.
+    Uses os.path on plain strings since this runs once per spec on every selection.
     """
-    gguf_path = models_dir / spec.hf_filename
-    if not gguf_path.exists():
+    models = os.fspath(models_dir)
+    if not os.path.exists(os.path.join(models, spec.hf_filename)):
         return False
     if spec.mmproj_filename:
-        mmproj_path = models_dir / spec.mmproj_filename
-        return mmproj_path.exists()
+        return os.path.exists(os.path.join(models, spec.mmproj_filename))
     return True
 
 def list_downloaded_specs(specs: list[LlmModelSpec], model_dir: Path) -> list[LlmModelSpec]:
@@ -125,11 +150,9 @@ def load_persisted_model_key(base_dir: Path) -> str | None:
     Load the previously selected model from disk, if present.
     """
     persist_path = _persist_path(base_dir)
-    if not persist_path.exists():
-        return None
     try:
-        payload = json.loads(persist_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        payload = _json_loads(persist_path.read_bytes())
+    except (OSError, ValueError):
         return None
     if not isinstance(payload, dict):
         return None
@@ -141,11 +164,17 @@ def load_persisted_model_key(base_dir: Path) -> str | None:
 def persist_model_key(base_dir: Path, key: str) -> None:
     """
     Persist the selected model key to disk
+    Skips the write when the stored key is already up to date, and writes via a
+    temp file + os.replace so readers never see a partially written file.
     """
+    if load_persisted_model_key(base_dir) == key:
+        return
     persist_path = _persist_path(base_dir)
     persist_path.parent.mkdir(parents=True, exist_ok=True)
     payload = {"model_key": key}
-    persist_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    tmp_path = persist_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(_json_dumps(payload))
+    os.replace(tmp_path, persist_path)
 
 def _format_spec_line(idx: int, spec: LlmModelSpec, recommended_key: str) -> str:
     """Format a single model entry line for display in selection UI."""
@@ -192,11 +221,14 @@ def prompt_model_choice_from_list(
     label: str,
 ) -> LlmModelSpec:
     """Prompt the user to select a model from a list."""
-    print(f"\nModel selection - {label}")
-    print(hw.summary)
-    print("Choose a model (press Enter for default):")
-    for i, spec in enumerate(specs, start=1):
-        print(_format_spec_line(i, spec, recommended.key))
+    # Build the whole menu and print it in one write
+    lines = [
+        f"\nModel selection - {label}",
+        hw.summary,
+        "Choose a model (press Enter for default):",
+    ]
+    lines.extend(_format_spec_line(i, spec, recommended.key) for i, spec in enumerate(specs, start=1))
+    print("\n".join(lines))
 
     default_spec = None
     if persisted_key:
@@ -223,15 +255,33 @@ def select_model_and_update_config(app_cfg: AppConfig) -> AppConfig:
     Returns updated app config with chosen model
     """
 
-    base_dir = Path(".appdata").resolve()
+    base_dir = get_app_base_dir()
 
     models_dir = get_models_dir(base_dir)
     models_dir.mkdir(parents=True, exist_ok=True)
 
     hw = get_hardware_info()
 
-    eligible_specs = [spec for spec in MODEL_SPECS if _fits_model(spec, hw)]
-    candidate_specs = eligible_specs if eligible_specs else MODEL_SPECS
+    # Classify every spec in a single pass: does it fit, and is it already downloaded?
+    # The all_* partitions are only used when nothing fits and we fall back to MODEL_SPECS.
+    eligible_specs: list[LlmModelSpec] = []
+    downloaded_specs: list[LlmModelSpec] = []
+    available_for_download: list[LlmModelSpec] = []
+    all_downloaded: list[LlmModelSpec] = []
+    all_available: list[LlmModelSpec] = []
+    for spec in MODEL_SPECS:
+        downloaded = is_model_downloaded(spec, models_dir)
+        (all_downloaded if downloaded else all_available).append(spec)
+        if _fits_model(spec, hw):
+            eligible_specs.append(spec)
+            (downloaded_specs if downloaded else available_for_download).append(spec)
+
+    if eligible_specs:
+        candidate_specs = eligible_specs
+    else:
+        candidate_specs = MODEL_SPECS
+        downloaded_specs = all_downloaded
+        available_for_download = all_available
 
     recommended = recommend_model(candidate_specs, hw)
 
@@ -240,16 +290,13 @@ def select_model_and_update_config(app_cfg: AppConfig) -> AppConfig:
     # If persisted choice fits, treat it as the recommended default (overrides the recommendation)
     # otherwise discard the persisted key
     if persisted_key is not None:
-        persisted_spec = next((s for s in candidate_specs if s.key == persisted_key), None)
-        if persisted_spec is not None:
+        persisted_spec = MODEL_SPECS_BY_KEY.get(persisted_key)
+        # candidate_specs is every spec that fits, or all specs when none fit
+        if persisted_spec is not None and (not eligible_specs or _fits_model(persisted_spec, hw)):
             recommended = persisted_spec
         else:
             persisted_key = None
 
-    # Identify downloaded model specs
-    downloaded_specs = list_downloaded_specs(candidate_specs, models_dir)
-    available_for_download = list_available_for_download(candidate_specs, models_dir)
-
     # If no installed models are available, skip straight to download flow.
     if downloaded_specs:
         action = prompt_initial_action(
@@ -290,13 +337,16 @@ def select_model_and_update_config(app_cfg: AppConfig) -> AppConfig:
     persist_model_key(base_dir, chosen_spec.key)
 
     # Create a new app.llm_config, app.llm_request_config, app.llm_server_config objects by copying the old ones and updating the relevant fields
+    # Probe each artifact once and derive the download state from those results
     gguf_path = models_dir / chosen_spec.hf_filename
-    model_is_downloaded = is_model_downloaded(chosen_spec, models_dir)
     mmproj_path = (
         models_dir / chosen_spec.mmproj_filename
         if chosen_spec.mmproj_filename is not None
         else None
     )
+    gguf_exists = os.path.exists(gguf_path)
+    mmproj_exists = mmproj_path is not None and os.path.exists(mmproj_path)
+    model_is_downloaded = gguf_exists and (not chosen_spec.mmproj_filename or mmproj_exists)
 
     new_llm_config = replace(
         app_cfg.llm_config,
@@ -309,20 +359,12 @@ def select_model_and_update_config(app_cfg: AppConfig) -> AppConfig:
         hf_filename=chosen_spec.hf_filename,
         hf_mmproj_filename=chosen_spec.mmproj_filename,
         llama_gguf_path=gguf_path if model_is_downloaded else None,
-        llama_mmproj_path=mmproj_path if mmproj_path is not None and mmproj_path.exists() else None,
+        llama_mmproj_path=mmproj_path if mmproj_exists else None,
     )
-    new_llm_request = replace(app_cfg.llm_request)
-    new_llm_server = replace(app_cfg.llm_server)
 
-    # Validate the new app.llm_config, app.llm_request_config, app.llm_server_config objects
+    # Validate the new app.llm_config; llm_request and llm_server are passed through
+    # unchanged and were already validated by build_settings
     new_llm_config.validate(allow_unresolved_model_paths=True)
-    new_llm_request.validate()
-    new_llm_server.validate()
-
-    # Now validated, replace the old app.llm_config, app.llm_request_config, app.llm_server_config configs with the new ones and return the updated app_cfg
-    return replace(
-        app_cfg,
-        llm_config=new_llm_config,
-        llm_request=new_llm_request,
-        llm_server=new_llm_server,
-    )
+
+    # Now validated, replace the old app.llm_config with the new one and return the updated app_cfg
+    return replace(app_cfg, llm_config=new_llm_config)
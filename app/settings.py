@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 
 from config.llm_request_config import LlmRequestConfig
 from config.llm_server_config import LlmServerConfig
@@ -19,6 +20,11 @@ class AppConfig:
     ged_config: GedConfig
     run_config: RunConfig
 
+def get_app_base_dir() -> Path:
+    # Get base directory to store model
+    # Base directory is .appdata while in dev mode
+    return Path(".appdata").resolve()
+
 def build_settings() -> AppConfig:
 
     assessment_paths = AssessmentPathsConfig.from_strings(
@@ -80,16 +86,14 @@ def build_settings() -> AppConfig:
     ged_config = GedConfig.from_strings(
         model_name="gotutiyan/token-ged-bert-large-cased-bin",
         batch_size=8,
-    )
-    ged_config.validate()
+    )  # from_strings validates
 
     run_config = RunConfig.from_strings(
         author="Daniel Parsons",
         single_paragraph_mode = True,
         max_llm_corrections=5,
         include_edited_text_section_policy=True
-    )
-    run_config.validate()
+    )  # from_strings validates
 
     return AppConfig(
         assessment_paths=assessment_paths,
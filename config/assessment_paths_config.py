@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
+import os
 
 @dataclass(frozen=True, slots=True)
 class AssessmentPathsConfig:
@@ -12,7 +13,22 @@ class AssessmentPathsConfig:
     explained_folder: Path
 
     def list_inputs(self) -> list[Path]:
-        return [p for p in self.input_folder.rglob("*") if p.is_file()]
+        # Walk with os.scandir so file/dir checks reuse the cached d_type from the
+        # directory listing instead of a stat per path. Like rglob, symlinked
+        # directories are not descended into.
+        files: list[Path] = []
+        pending = [os.fspath(self.input_folder)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            files.append(Path(entry.path))
+            except OSError:
+                continue
+        return files
 
     @staticmethod
     def from_strings(
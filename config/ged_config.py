@@ -1,23 +1,29 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
+# Safe bounds for GedConfig.batch_size
+_MIN_BATCH_SIZE = 1
+_MAX_BATCH_SIZE = 256
+
 @dataclass(frozen=True, slots=True)
 class GedConfig:
     model_name: str
     batch_size: int = 16
 
     def validate(self) -> None:
-        if not isinstance(self.model_name, str) or not self.model_name.strip():
+        name = self.model_name
+        if type(name) is not str or not name.strip():
             raise ValueError("GedConfig.model_name must be a non-empty string.")
         
-        if not isinstance(self.batch_size, int):
+        # Exact type check: bool is an int subclass but not a meaningful batch size
+        bs = self.batch_size
+        if type(bs) is not int:
             raise ValueError("GedConfig.batch_size must be an int.")
         
-        # Choose safe bounds
-        if self.batch_size < 1:
-            raise ValueError("GedConfig.batch_size must be >= 1")
-        if self.batch_size > 256:
-            raise ValueError("GedConfig.batch_size is unusually large (>256)")
+        if not _MIN_BATCH_SIZE <= bs <= _MAX_BATCH_SIZE:
+            if bs < _MIN_BATCH_SIZE:
+                raise ValueError(f"GedConfig.batch_size must be >= {_MIN_BATCH_SIZE}")
+            raise ValueError(f"GedConfig.batch_size is unusually large (>{_MAX_BATCH_SIZE})")
         
     @staticmethod
     def from_strings(
@@ -58,3 +58,5 @@ MODEL_SPECS: list[LlmModelSpec] = [
         notes="Thinking and instruct variant."
     )
 ]
+
+MODEL_SPECS_BY_KEY: dict[str, LlmModelSpec] = {spec.key: spec for spec in MODEL_SPECS}
@@ -1,6 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "f", "no", "n", "off"})
+
 @dataclass(frozen=True, slots=True)
 class RunConfig:
     author: str
@@ -38,9 +41,9 @@ class RunConfig:
                 return v
             if isinstance(v, str):
                 s = v.strip().lower()
-                if s in {"1", "true", "t", "yes", "y", "on"}:
+                if s in _TRUE_STRINGS:
                     return True
-                if s in {"0", "false", "f", "no", "n", "off"}:
+                if s in _FALSE_STRINGS:
                     return False
             raise ValueError(f"Expected a boolean or boolean-string, got {v!r}")
         
@@ -29,12 +29,9 @@ class DocxLoader():
         list[str]
             Paragraph texts, optionally stripped and optionally excluding empties
         """
-        path = Path(docx_path)
-        self._validate_docx_path(path)
-
-        doc = Document(str(path))
-        paras = [p.text for p in doc.paragraphs]
-        return self._postprocess(paras)
+        # Build the result straight from the paragraph stream instead of
+        # materialising the raw texts first and post-processing a copy
+        return list(self.iter_paragraphs(docx_path))
     
     def iter_paragraphs(self, docx_path: str | Path) -> Iterable[str]:
         """
@@ -52,13 +49,6 @@ class DocxLoader():
                 continue
             yield txt
 
-    def _postprocess(self, paragraphs: list[str]) -> list[str]:
-        if self.strip_whitespace:
-            paragraphs = [p.strip() for p in paragraphs]
-        if not self.keep_empty_paragraphs:
-            paragraphs = [p for p in paragraphs if p]
-        return paragraphs
-
     @staticmethod
     def _validate_docx_path(path: Path) -> None:
         if not path.exists():
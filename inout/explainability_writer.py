@@ -11,5 +11,9 @@ class ExplainabilityWriter:
     def write(self, docx_path: Path, lines: list[str]) -> Path:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         out_path = self.output_dir / f"{docx_path.stem}.txt"
-        out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # Write the joined body and trailing newline separately rather than
+        # concatenating, which would copy the whole report a second time
+        with out_path.open("w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+            f.write("\n")
         return out_path
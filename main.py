@@ -6,10 +6,6 @@ from utils.terminal_ui import Color, type_print, stage
 from app.settings import build_settings
 from app.select_model import select_model_and_update_config
 from app.bootstrap_llm import bootstrap_llm
-from app.container import build_container
-from app.pipeline import TestPipeline
-from nlp.llm.llm_client import ChatResponse, JsonSchemaChatRequest
-from nlp.llm.tasks.test_sequential import run_sequential_stream_demo
 
 def main():
     # Handle environment variables for production vs dev later
@@ -35,6 +31,11 @@ def main():
     type_print(f"Mode: {'Single Paragraph' if app_cfg.run_config.single_paragraph_mode else 'Essay'} (Set in run config)\n", color=Color.BLUE)
     type_print(f"Word document author name: {app_cfg.run_config.author} (Set in run config) \n", color=Color.BLUE)
 
+    # Imported here so the heavy model/client stack loads only once configuration has succeeded
+    from app.container import build_container
+    from app.pipeline import TestPipeline
+    from nlp.llm.llm_client import ChatResponse
+
     deps = build_container(app_cfg)
     llm_service = deps.get("llm_service")
     if llm_service is None:
@@ -85,6 +86,7 @@ def main():
     # except Exception as e:
     #     type_print(f"Streaming demo failed: {e}", color=Color.RED)
 
+    # from nlp.llm.tasks.test_sequential import run_sequential_stream_demo
     # type_print("Running sequential streaming demo (think mode)", color=Color.BLUE)
     # llm_stream_think = llm_service.with_mode("think")
     # try:
@@ -105,6 +107,7 @@ def main():
     # except Exception as e:
     #     type_print(f"Sequential streaming demo failed: {e}", color=Color.RED)
 
+    # from nlp.llm.llm_client import JsonSchemaChatRequest
     # type_print("Running parallel JSON-schema demo", color=Color.BLUE)
     # json_schema = {
     #     "type": "json_schema",
@@ -6,6 +6,11 @@ from typing import Any, AsyncIterator, Iterable, Iterator, Literal, Sequence
 import httpx
 import requests
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from config.llm_request_config import LlmRequestConfig
@@ -19,6 +24,20 @@ from nlp.llm.llm_types import (
 
 JSONDict = dict[str, Any]
 
+def _loads_stream_chunk(payload: str) -> Any:
+    """
+    Parse one SSE data payload, using orjson when it is installed.
+    orjson is stricter than json (e.g. it rejects lone surrogate escapes), so a
+    chunk it refuses is retried with json.loads before being treated as malformed.
+    Model-authored JSON (json-schema replies) always uses json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(payload)
+
 
 # ----- Accumulator class for streaming -----
 @dataclass
@@ -195,7 +214,7 @@ class OpenAICompatChatClient:
             ], True
 
         try:
-            data = json.loads(payload)
+            data = _loads_stream_chunk(payload)
         except json.JSONDecodeError as exc:
             raise RuntimeError(f"Malformed stream JSON chunk: {payload}") from exc
 
@@ -35,15 +35,17 @@ async def run_parallel_test(
         requests_,
         max_concurrency=app_cfg.llm_server.llama_n_parallel,
     )
+    # Separate successes from failures in a single pass over the outputs
+    successful_responses: list[ChatResponse] = []
+    failed_tasks: list[Exception] = []
     for i, res in enumerate(outputs):
         if isinstance(res, Exception):
             print(f"Task {i} failed with: {res}")
+            failed_tasks.append(res)
+        elif isinstance(res, ChatResponse):
+            successful_responses.append(res)
     elapsed_s = time.perf_counter() - started
 
-    # Separate successes from failure
-    successful_responses = [res for res in outputs if isinstance(res, ChatResponse)]
-    failed_tasks = [res for res in outputs if isinstance(res, Exception)]
-
     total_chars = sum(len(res.content or "") for res in successful_responses)
     chars_per_second = total_chars / elapsed_s if elapsed_s > 0 else 0.0
 
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 def run_sequential_stream_demo(llm_service: "LlmService") -> dict[str, Any]:
     started = time.perf_counter()
     outputs: list[ChatResponse | Exception] = []
+    # Track successes and failures as they happen rather than re-scanning outputs
+    successful_responses: list[ChatResponse] = []
+    failed_tasks: list[Exception] = []
 
     for idx, task in enumerate(TASKS, start=1):
         print(f"\n[Sequential Task {idx}] {task}")
@@ -22,13 +25,13 @@ def run_sequential_stream_demo(llm_service: "LlmService") -> dict[str, Any]:
                 user=task,
             )
             outputs.append(response)
+            successful_responses.append(response)
         except Exception as e:
             outputs.append(e)
+            failed_tasks.append(e)
             print(f"[Sequential Task {idx}] ERROR: {e}")
 
     elapsed_s = time.perf_counter() - started
-    successful_responses = [res for res in outputs if isinstance(res, ChatResponse)]
-    failed_tasks = [res for res in outputs if isinstance(res, Exception)]
     reasoning_count = sum(1 for res in successful_responses if res.reasoning_content)
 
     return {
@@ -114,6 +114,17 @@ class AssessmentPathsConfigTests(unittest.TestCase):
             files = sorted(cfg.list_inputs())
             self.assertEqual(files, sorted([first.resolve(), second.resolve()]))
 
+    def test_list_inputs_missing_folder_returns_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            cfg = AssessmentPathsConfig.from_strings(
+                input_folder=root / "missing",
+                output_folder=root / "out",
+                explained_folder=root / "explained",
+            )
+
+            self.assertEqual(cfg.list_inputs(), [])
+
 
 if __name__ == "__main__":
     unittest.main()
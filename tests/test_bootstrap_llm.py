@@ -320,8 +320,10 @@ class BootstrapLlmTests(unittest.TestCase):
 
                 self.assertIsNotNone(updated.llm_config.llama_gguf_path)
                 self.assertTrue(updated.llm_config.llama_gguf_path.exists())
+                self.assertEqual(updated.llm_config.llama_gguf_path.name, "model.gguf")
                 self.assertIsNotNone(updated.llm_config.llama_mmproj_path)
                 self.assertTrue(updated.llm_config.llama_mmproj_path.exists())
+                self.assertEqual(updated.llm_config.llama_mmproj_path.name, "mmproj.gguf")
             finally:
                 os.chdir(prev)
 
@@ -339,6 +341,38 @@ class BootstrapLlmTests(unittest.TestCase):
             finally:
                 os.chdir(prev)
 
+    def test_bootstrap_llm_checks_metadata_before_downloading(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            prev = Path.cwd()
+            os.chdir(root)
+            try:
+                cfg = _build_app_cfg(root)
+                cfg = AppConfig(
+                    assessment_paths=cfg.assessment_paths,
+                    llm_config=LlmConfig.from_strings(
+                        hf_repo_id=None,
+                        hf_filename="model.gguf",
+                        hf_mmproj_filename="mmproj.gguf",
+                        llama_server_model="demo",
+                        llama_model_key="demo",
+                        llama_model_display_name="Demo",
+                        llama_model_alias="Demo",
+                        llama_model_family="instruct",
+                    ),
+                    llm_server=cfg.llm_server,
+                    llm_request=cfg.llm_request,
+                    ged_config=cfg.ged_config,
+                    run_config=cfg.run_config,
+                )
+                with patch("app.bootstrap_llm.ensure_en_core_web_sm"):
+                    with patch("app.bootstrap_llm.hf_hub_download") as mocked:
+                        with self.assertRaises(RuntimeError):
+                            bootstrap_llm(cfg)
+                mocked.assert_not_called()
+            finally:
+                os.chdir(prev)
+
     def test_bootstrap_llm_calls_ensure_spacy_model(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
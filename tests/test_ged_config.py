@@ -30,6 +30,10 @@ class GedConfigTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             GedConfig.from_strings(model_name="m", batch_size="abc")
 
+    def test_validate_rejects_bool_batch_size(self) -> None:
+        with self.assertRaises(ValueError):
+            GedConfig(model_name="m", batch_size=True).validate()
+
 
 if __name__ == "__main__":
     unittest.main()
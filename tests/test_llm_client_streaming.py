@@ -89,6 +89,21 @@ class OpenAICompatChatClientStreamingTests(unittest.TestCase):
         self.assertEqual(response.finish_reason, "stop")
         self.assertEqual(response.model, "demo")
 
+    def test_stream_accepts_chunks_json_loads_accepts(self) -> None:
+        client = self._build_client().with_reasoning_mode("no_think")
+        # A lone surrogate escape is valid for json.loads but rejected by orjson
+        lines = [
+            'data: {"choices":[{"delta":{"content":"\\ud83d"}}]}',
+            'data: {"choices":[{"delta":{"content":"\\ud83d\\ude00"}}]}',
+            "data: [DONE]",
+        ]
+
+        with patch("nlp.llm.llm_client.requests.post", return_value=_FakeStreamResponse(lines)):
+            events = list(client.chat_stream(system="sys", user="task"))
+
+        content = [e.text for e in events if e.channel == "content"]
+        self.assertEqual(content, ["\ud83d", "\U0001F600"])
+
     def test_stream_malformed_json_raises_runtime_error(self) -> None:
         client = self._build_client().with_reasoning_mode("no_think")
         lines = ['data: {"choices":[{"delta":{"content":"ok"}}]}', "data: {bad json}"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import unittest
 
-from config.llm_model_spec import MODEL_SPECS
+from config.llm_model_spec import MODEL_SPECS, MODEL_SPECS_BY_KEY
 
 
 class LlmModelSpecTests(unittest.TestCase):
@@ -23,6 +23,11 @@ class LlmModelSpecTests(unittest.TestCase):
                 spec.mmproj_filename is None or bool(spec.mmproj_filename.strip())
             )
 
+    def test_model_specs_by_key_indexes_every_spec(self) -> None:
+        self.assertEqual(len(MODEL_SPECS_BY_KEY), len(MODEL_SPECS))
+        for spec in MODEL_SPECS:
+            self.assertIs(MODEL_SPECS_BY_KEY[spec.key], spec)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import tempfile
 import unittest
@@ -14,6 +15,7 @@ from app.select_model import (
     list_downloaded_specs,
     load_persisted_model_key,
     persist_model_key,
+    recommend_model,
     select_model_and_update_config,
     HardwareInfo,
 )
@@ -110,6 +112,28 @@ class SelectModelHelpersTests(unittest.TestCase):
             self.assertEqual([s.key for s in downloaded], ["a"])
             self.assertEqual([s.key for s in available], ["b"])
 
+    def test_recommend_model_prefers_largest_fit_then_smallest(self) -> None:
+        def _spec(key: str, ram: int, vram: int) -> LlmModelSpec:
+            return LlmModelSpec(
+                key=key,
+                display_name=key.upper(),
+                hf_repo_id=f"repo/{key}",
+                hf_filename=f"{key}.gguf",
+                mmproj_filename=None,
+                backend="server",
+                model_family="instruct",
+                min_ram_gb=ram,
+                min_vram_gb=vram,
+                param_size_b=1,
+                notes="n",
+            )
+
+        specs = [_spec("small", 4, 2), _spec("large", 16, 8), _spec("medium", 8, 4)]
+        roomy = HardwareInfo(total_ram_gb=12.0, cpu_count=4, cuda_vram_gb=None, is_mps=False)
+        tiny = HardwareInfo(total_ram_gb=2.0, cpu_count=4, cuda_vram_gb=None, is_mps=False)
+        self.assertEqual(recommend_model(specs, roomy).key, "medium")
+        self.assertEqual(recommend_model(specs, tiny).key, "small")
+
     def test_load_and_persist_model_key(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             base_dir = Path(tmpdir)
@@ -122,6 +146,18 @@ class SelectModelHelpersTests(unittest.TestCase):
             _persist_path(base_dir).write_text("{bad json", encoding="utf-8")
             self.assertIsNone(load_persisted_model_key(base_dir))
 
+    def test_persist_model_key_skips_unchanged_key_and_leaves_no_temp_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            persist_model_key(base_dir, "qwen3_4b_q8")
+            persist_path = _persist_path(base_dir)
+            self.assertFalse(persist_path.with_suffix(".json.tmp").exists())
+
+            with patch("app.select_model.os.replace") as mock_replace:
+                persist_model_key(base_dir, "qwen3_4b_q8")
+            mock_replace.assert_not_called()
+            self.assertEqual(json.loads(persist_path.read_text(encoding="utf-8")), {"model_key": "qwen3_4b_q8"})
+
 
 class SelectModelIntegrationTests(unittest.TestCase):
     def test_select_model_updates_config_and_persists_key(self) -> None:
@@ -18,8 +18,9 @@ class Color:
 
 # --------- TYPEWRITER ----------
 def type_print(text, delay=0.01, color=Color.RESET, newline=True):
+    reset = Color.RESET
     for ch in text:
-        sys.stdout.write(color + ch + Color.RESET)
+        sys.stdout.write(color + ch + reset)
         sys.stdout.flush()
         time.sleep(delay)
     if newline: